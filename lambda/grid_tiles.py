@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+import io
+import json
+import math
+import hashlib
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import matplotlib.patches as patches
+from collections import Counter, defaultdict
+from functools import lru_cache
+from maidenhead_map import maidenhead_to_bounds
+
+# Web-mercator slippy map tiles (z/x/y, 256 px)
+TILE_SIZE = 256
+MAX_ZOOM = 12
+MAX_LATITUDE = 85.0511287798
+EARTH_RADIUS = 6378137.0
+
+# Zoom level at which 6-character subsquares are drawn instead of 4-character squares
+SUBSQUARE_MIN_ZOOM = 8
+
+# Part of every tile URL and S3 key; bump after any change to how tiles are drawn so cached tiles are replaced
+TILE_STYLE_VERSION = 'v2'
+
+# Pseudo-band combining every band in the log
+ALL_BANDS = 'all'
+
+def lon_to_mercator(lon):
+    """Convert longitude in degrees to web-mercator x in meters"""
+    return EARTH_RADIUS * math.radians(lon)
+
+def lat_to_mercator(lat):
+    """Convert latitude in degrees to web-mercator y in meters"""
+    lat = max(-MAX_LATITUDE, min(MAX_LATITUDE, lat))
+    return EARTH_RADIUS * math.log(math.tan(math.pi / 4 + math.radians(lat) / 2))
+
+def tile_bounds(z, x, y):
+    """Convert slippy map tile coordinates to lat/lon bounds"""
+    n = 2 ** z
+    lon_min = x / n * 360.0 - 180.0
+    lon_max = (x + 1) / n * 360.0 - 180.0
+    lat_max = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * y / n))))
+    lat_min = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * (y + 1) / n))))
+    return lat_min, lat_max, lon_min, lon_max
+
+def is_valid_tile(z, x, y):
+    """Check if tile coordinates exist at the given zoom level"""
+    return 0 <= z <= MAX_ZOOM and 0 <= x < 2 ** z and 0 <= y < 2 ** z
+
+def build_tile_dataset(grids_by_band, callsign):
+    """Aggregate parsed grids into per-band grid counts for tile rendering"""
+    bands = {}
+    totals = Counter()
+    for band, grids in grids_by_band.items():
+        counts = Counter(grid.upper() for grid in grids)
+        bands[band] = dict(counts)
+        totals.update(counts)
+    bands[ALL_BANDS] = dict(totals)
+    return {'callsign': callsign, 'bands': bands}
+
+def dataset_hash(dataset):
+    """Stable content hash of a tile dataset, used as its cache key"""
+    canonical = json.dumps(dataset, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+def use_subsquares(z):
+    """Whether a zoom level is drawn at 6-character resolution"""
+    return z >= SUBSQUARE_MIN_ZOOM
+
+def build_tile_layer(grid_counts, subsquares):
+    """Precompute square bounds and the color scale for one band at one resolution"""
+    outlines = []
+    if subsquares and any(len(grid) == 6 for grid in grid_counts):
+        # Only subsquares are filled and set the color scale; 4-character squares are outlined beneath them
+        layer_counts = {grid: count for grid, count in grid_counts.items() if len(grid) == 6}
+        outlines = [bounds for bounds in map(maidenhead_to_bounds, (grid for grid in grid_counts if len(grid) == 4))
+                    if bounds]
+    elif subsquares:
+        layer_counts = grid_counts
+    else:
+        layer_counts = defaultdict(int)
+        for grid, count in grid_counts.items():
+            layer_counts[grid[:4]] += count
+
+    squares = []
+    for grid, count in layer_counts.items():
+        bounds = maidenhead_to_bounds(grid)
+        if bounds:
+            squares.append((bounds, count))
+
+    max_count = max((count for _, count in squares), default=0)
+    return {'squares': squares, 'outlines': outlines, 'max_count': max_count}
+
+def tile_squares(layer, z, x, y):
+    """Filled squares and outlines of a layer that intersect one tile"""
+    tile_lat_min, tile_lat_max, tile_lon_min, tile_lon_max = tile_bounds(z, x, y)
+
+    def intersects(bounds):
+        return (bounds[0] < tile_lat_max and bounds[1] > tile_lat_min and
+                bounds[2] < tile_lon_max and bounds[3] > tile_lon_min)
+
+    visible = [(bounds, count) for bounds, count in layer['squares'] if intersects(bounds)]
+    outlines = [bounds for bounds in layer['outlines'] if intersects(bounds)]
+    return visible, outlines
+
+@lru_cache(maxsize=1)
+def blank_tile():
+    """Transparent PNG shared by every tile with no grid squares"""
+    fig = plt.figure(figsize=(1, 1), dpi=TILE_SIZE)
+    try:
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', dpi=TILE_SIZE, transparent=True)
+        return buffer.getvalue()
+    finally:
+        plt.close(fig)
+
+def render_tile(layer, z, x, y):
+    """Render the grid squares that intersect one tile as a transparent PNG"""
+    visible, outlines = tile_squares(layer, z, x, y)
+    if not visible and not outlines:
+        return blank_tile()
+
+    tile_lat_min, tile_lat_max, tile_lon_min, tile_lon_max = tile_bounds(z, x, y)
+    fig = plt.figure(figsize=(1, 1), dpi=TILE_SIZE)
+    try:
+        ax = fig.add_axes([0, 0, 1, 1])
+        ax.set_axis_off()
+        ax.set_xlim(lon_to_mercator(tile_lon_min), lon_to_mercator(tile_lon_max))
+        ax.set_ylim(lat_to_mercator(tile_lat_min), lat_to_mercator(tile_lat_max))
+
+        for grid_lat_min, grid_lat_max, grid_lon_min, grid_lon_max in outlines:
+            x_min = lon_to_mercator(grid_lon_min)
+            y_min = lat_to_mercator(grid_lat_min)
+            rect = patches.Rectangle((x_min, y_min),
+                                     lon_to_mercator(grid_lon_max) - x_min,
+                                     lat_to_mercator(grid_lat_max) - y_min,
+                                     linewidth=0.8,
+                                     edgecolor='black',
+                                     facecolor='none')
+            ax.add_patch(rect)
+
+        max_count = layer['max_count']
+        for (grid_lat_min, grid_lat_max, grid_lon_min, grid_lon_max), count in visible:
+            x_min = lon_to_mercator(grid_lon_min)
+            y_min = lat_to_mercator(grid_lat_min)
+
+            intensity = count / max_count
+            color = plt.cm.Reds(0.3 + 0.7 * intensity)
+
+            rect = patches.Rectangle((x_min, y_min),
+                                     lon_to_mercator(grid_lon_max) - x_min,
+                                     lat_to_mercator(grid_lat_max) - y_min,
+                                     linewidth=0.5,
+                                     edgecolor='black',
+                                     facecolor=color,
+                                     alpha=0.8)
+            ax.add_patch(rect)
+
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', dpi=TILE_SIZE, transparent=True)
+        return buffer.getvalue()
+    finally:
+        plt.close(fig)
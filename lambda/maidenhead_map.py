@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 import re
 import csv
+import mmap
+import os
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 import matplotlib.patheffects as path_effects
@@ -76,11 +78,7 @@ def parse_csv_grids(filename):
             header_row_idx = 0
             
             for i, line in enumerate(lines):
-                line_lower = line.lower()
-                # Look for multiple header fields in the same line
-                field_count = sum(1 for field in ['date', 'time', 'call', 'grid', 'freq', 'band'] 
-                                if field in line_lower)
-                if field_count >= 3:  # Need at least 3 fields to be a header row
+                if is_csv_header(line):
                     header_row_idx = i
                     break
             
@@ -139,8 +137,68 @@ def parse_csv_grids(filename):
     
     return dict(grids_by_band), callsign
 
+# QSO line with at least six fields: captures the frequency and the exchange fields after mycall.
+# [^\S\n] and \S use the same whitespace as str.split(), and the leading newline lets the regex
+# engine skip ahead between lines.
+CABRILLO_QSO = re.compile(
+    r'\n[^\S\n]*+QSO:\S*+[^\S\n]++(\S++)[^\S\n]++\S++[^\S\n]++\S++[^\S\n]++\S++[^\S\n]++\S++([^\n]*+)')
+CABRILLO_CALLSIGN = re.compile(r'\n[^\S\n]*+CALLSIGN:([^\n]*+)')
+
+CABRILLO_CHUNK_SIZE = 1 << 20
+
 def parse_cabrillo_grids(filename):
     """Extract Maidenhead grid squares by band from Cabrillo format file"""
+    grids_by_band = {}
+    callsign = "Unknown"
+    band_cache = {}
+    grid_cache = {}
+    
+    try:
+        with open(filename, 'r') as f:
+            while True:
+                chunk = f.read(CABRILLO_CHUNK_SIZE)
+                if not chunk:
+                    break
+                # Finish the last line so no QSO is split across blocks
+                block = '\n' + chunk + f.readline()
+                
+                if 'CALLSIGN:' in block:
+                    for value in CABRILLO_CALLSIGN.findall(block):
+                        callsign = value.strip()
+                
+                # Group QSOs by band so their exchange fields can be split and looked up in one pass
+                qsos = CABRILLO_QSO.findall(block)
+                qsos_by_band = defaultdict(list)
+                for qso in qsos:
+                    band = band_cache.get(qso[0])
+                    if band is None:
+                        band = band_cache[qso[0]] = freq_to_band(qso[0])
+                    qsos_by_band[band].append(qso)
+                
+                new_bands = []
+                for band, band_qsos in qsos_by_band.items():
+                    fields = ' '.join([exchange for _, exchange in band_qsos]).split()
+                    for field in set(fields).difference(grid_cache):
+                        grid = field.upper()
+                        grid_cache[field] = grid if is_valid_grid(grid) else ''
+                    grids = list(filter(None, map(grid_cache.__getitem__, fields)))
+                    if band in grids_by_band:
+                        grids_by_band[band].extend(grids)
+                    elif grids:
+                        # Bands are listed in the order their first grid appears, as in parse_cabrillo_lines
+                        first = next(qso for qso in band_qsos if any(map(grid_cache.__getitem__, qso[1].split())))
+                        new_bands.append((qsos.index(first), band, grids))
+                
+                for _, band, grids in sorted(new_bands):
+                    grids_by_band[band] = grids
+    except FileNotFoundError:
+        print(f"File {filename} not found")
+        return {}, callsign
+    
+    return grids_by_band, callsign
+
+def parse_cabrillo_lines(filename):
+    """Extract Maidenhead grid squares by band from Cabrillo format file, one decoded line at a time"""
     grids_by_band = defaultdict(list)
     callsign = "Unknown"
     
@@ -171,6 +229,132 @@ def parse_cabrillo_grids(filename):
     
     return dict(grids_by_band), callsign
 
+# ADIF field tag: <NAME:length> or <NAME:length:type>, or a bare <EOH>/<EOR> marker
+ADIF_TAG = re.compile(rb'<([A-Za-z0-9_]+)(?::(\d+)(?::[A-Za-z])?)?>')
+
+# Content signatures used to detect the log format
+ADIF_SIGNATURE = re.compile(rb'<(?:EOH|EOR)>|<(?:CALL|QSO_DATE|BAND|FREQ|GRIDSQUARE):\d+', re.IGNORECASE)
+CABRILLO_SIGNATURE = re.compile(rb'^(?:START-OF-LOG:|QSO:)', re.MULTILINE)
+
+# Field names that mark a CSV header row when at least 3 appear in the same line
+CSV_HEADER_FIELDS = ['date', 'time', 'call', 'grid', 'freq', 'band']
+
+UNSUPPORTED_FORMAT_MESSAGE = "Unsupported file format. Use Cabrillo (.cbr, .log), ADIF (.adi, .adif) or CSV (.csv) files."
+
+def parse_adif_grids(filename):
+    """Extract Maidenhead grid squares by band from ADIF format file"""
+    grids_by_band = defaultdict(list)
+    callsign = "Unknown"
+    # Share one string object per distinct grid to keep large logs compact
+    grid_cache = {}
+    band_cache = {}
+    
+    def add_grid(band, raw):
+        grid = grid_cache.get(raw)
+        if grid is None:
+            grid = raw.decode('ascii', 'replace').strip().upper()[:6]
+            grid = grid if is_valid_grid(grid) else ''
+            grid_cache[raw] = grid
+        if grid:
+            grids_by_band[band].append(grid)
+    
+    try:
+        with open(filename, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return {}, callsign
+            # Scan tags directly on the mapped bytes; only wanted values are copied out
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                band = freq = gridsquare = vucc_grids = None
+                pos = 0
+                search = ADIF_TAG.search
+                
+                while True:
+                    tag = search(data, pos)
+                    if not tag:
+                        break
+                    pos = tag.end()
+                    length = tag.group(2)
+                    
+                    if length is None:
+                        name = tag.group(1).upper()
+                        if name == b'EOR':
+                            if gridsquare or vucc_grids:
+                                key = band if band else freq
+                                record_band = band_cache.get(key)
+                                if record_band is None:
+                                    record_band = adif_band(band, freq)
+                                    band_cache[key] = record_band
+                                if gridsquare:
+                                    add_grid(record_band, gridsquare)
+                                if vucc_grids:
+                                    for raw in vucc_grids.split(b','):
+                                        add_grid(record_band, raw)
+                        if name in (b'EOR', b'EOH'):
+                            band = freq = gridsquare = vucc_grids = None
+                        continue
+                    
+                    length = int(length)
+                    name = tag.group(1).upper()
+                    if name == b'GRIDSQUARE':
+                        gridsquare = data[pos:pos + length]
+                    elif name == b'BAND':
+                        band = data[pos:pos + length]
+                    elif name == b'FREQ':
+                        freq = data[pos:pos + length]
+                    elif name == b'VUCC_GRIDS':
+                        vucc_grids = data[pos:pos + length]
+                    elif name == b'STATION_CALLSIGN' and callsign == "Unknown":
+                        callsign = data[pos:pos + length].decode('ascii', 'replace').strip().upper()
+                    # Skip the value so '<' inside it is never mistaken for a tag
+                    pos += length
+    except FileNotFoundError:
+        print(f"File {filename} not found")
+        return {}, callsign
+    
+    return dict(grids_by_band), callsign
+
+def adif_band(band, freq):
+    """Convert ADIF BAND or FREQ (MHz) field bytes to a band name"""
+    if band:
+        return freq_to_band(band.decode('ascii', 'replace'))
+    if freq:
+        try:
+            return freq_to_band(str(int(round(float(freq) * 1000))))
+        except (ValueError, OverflowError):
+            # Not a number, NaN or infinite: only this record's band is unknown
+            pass
+    return "Unknown"
+
+def is_csv_header(line):
+    """Check if a line looks like a CSV header row"""
+    line_lower = line.lower()
+    return sum(1 for field in CSV_HEADER_FIELDS if field in line_lower) >= 3
+
+def detect_log_format(filename):
+    """Detect log format ('adif', 'cabrillo' or 'csv') from file content, then extension"""
+    try:
+        with open(filename, 'rb') as f:
+            head = f.read(8192)
+    except FileNotFoundError:
+        return None
+    
+    if ADIF_SIGNATURE.search(head):
+        return 'adif'
+    if CABRILLO_SIGNATURE.search(head.lstrip()):
+        return 'cabrillo'
+    if any(',' in line and is_csv_header(line)
+           for line in head.decode('utf-8', errors='replace').splitlines()):
+        return 'csv'
+    
+    name = filename.lower()
+    if name.endswith(('.adi', '.adif')):
+        return 'adif'
+    if name.endswith(('.cbr', '.log')):
+        return 'cabrillo'
+    if name.endswith('.csv'):
+        return 'csv'
+    return None
+
 def is_valid_grid(grid):
     """Check if string is a valid Maidenhead grid square"""
     if not grid or len(grid) not in [4, 6]:
@@ -555,7 +739,7 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='Generate Maidenhead grid square maps from contest logs')
-    parser.add_argument('filename', help='Contest log file (.cbr for Cabrillo, .csv for CSV)')
+    parser.add_argument('filename', help='Contest log file (Cabrillo, ADIF or CSV; format is auto-detected)')
     parser.add_argument('--continents', nargs='+', 
                        choices=['north_america', 'south_america', 'europe', 'africa', 'asia', 'oceania'],
                        help='Continents to include (auto-detected if not specified)')
@@ -567,15 +751,19 @@ def main():
     args = parser.parse_args()
     filename = args.filename
     
-    # Determine file format based on extension
-    if filename.lower().endswith('.csv'):
+    # Determine file format from content, falling back to the extension
+    log_format = detect_log_format(filename)
+    if log_format == 'csv':
         grids_by_band, callsign = parse_csv_grids(filename)
         print(f"Parsed CSV file: {filename}")
-    elif filename.lower().endswith(('.cbr', '.log')):
+    elif log_format == 'cabrillo':
         grids_by_band, callsign = parse_cabrillo_grids(filename)
         print(f"Parsed Cabrillo file: {filename}")
+    elif log_format == 'adif':
+        grids_by_band, callsign = parse_adif_grids(filename)
+        print(f"Parsed ADIF file: {filename}")
     else:
-        print("Unsupported file format. Use .csv, .cbr, or .log files.")
+        print(UNSUPPORTED_FORMAT_MESSAGE)
         sys.exit(1)
     
     if grids_by_band:
@@ -3,8 +3,10 @@ import boto3
 import base64
 import tempfile
 import os
+import re
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any
 import subprocess
 import sys
@@ -16,10 +18,25 @@ logger.setLevel(logging.INFO)
 # Initialize AWS clients
 s3_client = boto3.client('s3')
 
+# S3 prefix for tile datasets and rendered tiles
+TILES_PREFIX = 'tiles'
+
+# Tile z/x/y path segment: a decimal number without leading zeros
+TILE_COORDINATE = re.compile(r'0|[1-9][0-9]*')
+
+# Number of rendered tiles kept in memory per container
+TILE_CACHE_SIZE = int(os.environ.get('TILE_CACHE_SIZE', '512'))
+
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Lambda handler for generating Maidenhead grid square maps
     """
+    resource = event.get('resource') or ''
+    if resource == '/tiles':
+        return create_tile_dataset(event)
+    if resource.startswith('/tiles/'):
+        return get_tile(event)
+
     try:
         # Parse request body
         body = json.loads(event['body']) if isinstance(event.get('body'), str) else event.get('body', {})
@@ -44,18 +61,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             # Write file content to temporary file
             file_path = os.path.join(temp_dir, file_name)
             
-            # Handle base64 encoded content
-            try:
-                if file_content.startswith('data:'):
-                    # Remove data URL prefix
-                    file_content = file_content.split(',')[1]
-                file_data = base64.b64decode(file_content)
-                with open(file_path, 'wb') as f:
-                    f.write(file_data)
-            except:
-                # Assume plain text content
-                with open(file_path, 'w') as f:
-                    f.write(file_content)
+            write_log_file(file_content, file_path)
             
             # Copy the map generator script to temp directory
             script_content = get_map_generator_script()
@@ -146,3 +152,192 @@ def get_map_generator_script() -> str:
     script_path = os.path.join(os.path.dirname(__file__), 'maidenhead_map.py')
     with open(script_path, 'r') as f:
         return f.read()
+
+
+def write_log_file(file_content: str, file_path: str) -> None:
+    """
+    Writes uploaded log content (base64, data URL or plain text) to disk
+    """
+    # Handle base64 encoded content
+    try:
+        if file_content.startswith('data:'):
+            # Remove data URL prefix
+            file_content = file_content.split(',')[1]
+        file_data = base64.b64decode(file_content)
+        with open(file_path, 'wb') as f:
+            f.write(file_data)
+    except:
+        # Assume plain text content
+        with open(file_path, 'w') as f:
+            f.write(file_content)
+
+def json_response(status_code: int, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Builds an API Gateway proxy response with a JSON body
+    """
+    return {
+        'statusCode': status_code,
+        'headers': {'Content-Type': 'application/json'},
+        'body': json.dumps(payload)
+    }
+
+def create_tile_dataset(event: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Parses a log into per-band grid counts and stores them for tile rendering
+    """
+    try:
+        body = json.loads(event['body']) if isinstance(event.get('body'), str) else event.get('body', {})
+
+        file_content = body.get('fileContent', '')
+        file_name = os.path.basename(body.get('fileName', 'contest_log'))
+        callsign = body.get('callsign', 'Unknown')
+
+        if not file_content:
+            return json_response(400, {'error': 'No file content provided'})
+
+        import grid_tiles
+        from maidenhead_map import (UNSUPPORTED_FORMAT_MESSAGE, detect_log_format, parse_adif_grids,
+                                    parse_cabrillo_grids, parse_csv_grids)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, file_name)
+            write_log_file(file_content, file_path)
+
+            log_format = detect_log_format(file_path)
+            if log_format == 'adif':
+                grids_by_band, _ = parse_adif_grids(file_path)
+            elif log_format == 'csv':
+                grids_by_band, _ = parse_csv_grids(file_path)
+            elif log_format == 'cabrillo':
+                grids_by_band, _ = parse_cabrillo_grids(file_path)
+            else:
+                return json_response(400, {'error': UNSUPPORTED_FORMAT_MESSAGE})
+
+        if not grids_by_band:
+            return json_response(400, {'error': 'No Maidenhead grid squares found in file'})
+
+        dataset = grid_tiles.build_tile_dataset(grids_by_band, callsign)
+        dataset_id = grid_tiles.dataset_hash(dataset)
+
+        s3_client.put_object(
+            Bucket=os.environ['MAPS_BUCKET'],
+            Key=f"{TILES_PREFIX}/{dataset_id}/dataset.json",
+            Body=json.dumps(dataset).encode('utf-8'),
+            ContentType='application/json'
+        )
+
+        logger.info(f"Created tile dataset {dataset_id} for {callsign}")
+
+        return json_response(200, {
+            'success': True,
+            'callsign': callsign,
+            'datasetId': dataset_id,
+            'tileStyle': grid_tiles.TILE_STYLE_VERSION,
+            'bands': sorted(dataset['bands']),
+            'maxZoom': grid_tiles.MAX_ZOOM
+        })
+
+    except Exception as e:
+        logger.error(f"Error creating tile dataset: {str(e)}")
+        return json_response(500, {'error': f'Internal server error: {str(e)}'})
+
+def get_tile(event: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Serves one PNG tile of a dataset's grid coverage
+    """
+    try:
+        import grid_tiles
+
+        params = event.get('pathParameters') or {}
+        dataset_id = params.get('dataset', '')
+        style = params.get('style', '')
+        band = params.get('band', '')
+        # Accept one spelling of each tile URL, so CloudFront keeps a single cache entry per tile
+        y_param = params.get('y', '')
+        coordinates = (params.get('z', ''), params.get('x', ''), y_param[:-4] if y_param.endswith('.png') else '')
+        if not all(TILE_COORDINATE.fullmatch(value) for value in coordinates):
+            return json_response(400, {'error': 'Invalid tile coordinates'})
+        z, x, y = map(int, coordinates)
+
+        if not dataset_id.isalnum() or not grid_tiles.is_valid_tile(z, x, y):
+            return json_response(400, {'error': 'Invalid tile coordinates'})
+
+        if style != grid_tiles.TILE_STYLE_VERSION:
+            return json_response(404, {'error': 'Unknown tile style'})
+
+        try:
+            tile = get_tile_png(dataset_id, band, z, x, y)
+        except KeyError:
+            return json_response(404, {'error': 'Unknown dataset or band'})
+
+        return {
+            'statusCode': 200,
+            'headers': {
+                'Content-Type': 'image/png',
+                'Cache-Control': 'public, max-age=86400, immutable'
+            },
+            'body': base64.b64encode(tile).decode('ascii'),
+            'isBase64Encoded': True
+        }
+
+    except Exception as e:
+        logger.error(f"Error rendering tile: {str(e)}")
+        return json_response(500, {'error': f'Internal server error: {str(e)}'})
+
+@lru_cache(maxsize=TILE_CACHE_SIZE)
+def get_tile_png(dataset_id: str, band: str, z: int, x: int, y: int):
+    """
+    Returns tile PNG bytes from the in-memory LRU, then S3, rendering on a miss;
+    tiles with no grid squares get the shared blank tile
+    """
+    import grid_tiles
+    from botocore.exceptions import ClientError
+
+    layer = get_tile_layer(dataset_id, band, grid_tiles.use_subsquares(z))
+    visible, outlines = grid_tiles.tile_squares(layer, z, x, y)
+    if not visible and not outlines:
+        # Empty tiles are all the same blank PNG, so they are neither fetched from nor stored in S3
+        return grid_tiles.blank_tile()
+
+    maps_bucket = os.environ['MAPS_BUCKET']
+    s3_key = f"{TILES_PREFIX}/{dataset_id}/{grid_tiles.TILE_STYLE_VERSION}/{band}/{z}/{x}/{y}.png"
+
+    try:
+        return s3_client.get_object(Bucket=maps_bucket, Key=s3_key)['Body'].read()
+    except ClientError as e:
+        if e.response['Error']['Code'] not in ('NoSuchKey', '404'):
+            raise
+
+    tile = grid_tiles.render_tile(layer, z, x, y)
+    s3_client.put_object(Bucket=maps_bucket, Key=s3_key, Body=tile, ContentType='image/png')
+    return tile
+
+@lru_cache(maxsize=32)
+def get_tile_layer(dataset_id: str, band: str, subsquares: bool):
+    """
+    Loads a band of a stored dataset and precomputes its squares for rendering
+    """
+    import grid_tiles
+
+    dataset = load_tile_dataset(dataset_id)
+    if band not in dataset['bands']:
+        raise KeyError(band)
+    return grid_tiles.build_tile_layer(dataset['bands'][band], subsquares)
+
+@lru_cache(maxsize=16)
+def load_tile_dataset(dataset_id: str):
+    """
+    Reads a tile dataset from S3, raising KeyError if it does not exist
+    """
+    from botocore.exceptions import ClientError
+
+    try:
+        obj = s3_client.get_object(
+            Bucket=os.environ['MAPS_BUCKET'],
+            Key=f"{TILES_PREFIX}/{dataset_id}/dataset.json"
+        )
+    except ClientError as e:
+        if e.response['Error']['Code'] in ('NoSuchKey', '404'):
+            raise KeyError(dataset_id)
+        raise
+    return json.loads(obj['Body'].read())
@@ -41,7 +41,18 @@ export class GridMapperWebStack extends cdk.Stack {
     const mapGeneratorFunction = new lambda.Function(this, 'MapGeneratorFunction', {
       runtime: lambda.Runtime.PYTHON_3_11,
       handler: 'map_generator.handler',
-      code: lambda.Code.fromAsset('lambda'),
+      // Install plotting dependencies at deploy time so tile requests never wait on pip.
+      // boto3 is provided by the Lambda runtime.
+      code: lambda.Code.fromAsset('lambda', {
+        bundling: {
+          image: lambda.Runtime.PYTHON_3_11.bundlingImage,
+          command: [
+            'bash', '-c',
+            'grep -v boto3 requirements.txt > /tmp/requirements.txt && ' +
+            'pip install -r /tmp/requirements.txt -t /asset-output && cp -au . /asset-output',
+          ],
+        },
+      }),
       timeout: cdk.Duration.minutes(5),
       memorySize: 1024,
       environment: {
@@ -57,6 +68,7 @@ export class GridMapperWebStack extends cdk.Stack {
     const api = new apigateway.RestApi(this, 'GridMapperApi', {
       restApiName: 'Grid Mapper API',
       description: 'API for generating Maidenhead grid square maps',
+      binaryMediaTypes: ['image/*'],
       defaultCorsPreflightOptions: {
         allowOrigins: apigateway.Cors.ALL_ORIGINS,
         allowMethods: apigateway.Cors.ALL_METHODS,
@@ -69,6 +81,18 @@ export class GridMapperWebStack extends cdk.Stack {
     const mapsResource = api.root.addResource('generate-map');
     mapsResource.addMethod('POST', mapIntegration);
 
+    // Slippy-map tiles: POST /tiles builds a dataset, GET renders z/x/y tiles of it in the current tile style
+    const tilesResource = api.root.addResource('tiles');
+    tilesResource.addMethod('POST', mapIntegration);
+    tilesResource
+      .addResource('{dataset}')
+      .addResource('{style}')
+      .addResource('{band}')
+      .addResource('{z}')
+      .addResource('{x}')
+      .addResource('{y}')
+      .addMethod('GET', mapIntegration);
+
     // CloudFront distribution
     const distribution = new cloudfront.Distribution(this, 'Distribution', {
       defaultBehavior: {
@@ -77,6 +101,26 @@ export class GridMapperWebStack extends cdk.Stack {
         cachePolicy: cloudfront.CachePolicy.CACHING_OPTIMIZED,
       },
       additionalBehaviors: {
+        // Tiles are immutable per dataset hash and tile style, so they are cached at the edge for as long as the
+        // Lambda's Cache-Control allows. Accept is forwarded so API Gateway returns binary PNGs for image/*.
+        // POST /api/tiles does not match this pattern and falls through to the uncached /api/* behavior.
+        '/api/tiles/*': {
+          origin: new origins.RestApiOrigin(api),
+          viewerProtocolPolicy: cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+          cachePolicy: new cloudfront.CachePolicy(this, 'TileCachePolicy', {
+            comment: 'Grid map tiles, TTL from origin Cache-Control',
+            minTtl: cdk.Duration.seconds(0),
+            defaultTtl: cdk.Duration.days(1),
+            maxTtl: cdk.Duration.days(365),
+            enableAcceptEncodingGzip: false,
+            enableAcceptEncodingBrotli: false,
+          }),
+          originRequestPolicy: new cloudfront.OriginRequestPolicy(this, 'TileOriginRequestPolicy', {
+            comment: 'Forward Accept so API Gateway returns binary tiles',
+            headerBehavior: cloudfront.OriginRequestHeaderBehavior.allowList('Accept'),
+          }),
+          allowedMethods: cloudfront.AllowedMethods.ALLOW_GET_HEAD,
+        },
         '/api/*': {
           origin: new origins.RestApiOrigin(api),
           viewerProtocolPolicy: cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
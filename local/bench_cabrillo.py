@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, 'lambda'))
+import maidenhead_map
+
+# Frequencies in kHz as written in Cabrillo logs, covering HF, VHF shorthand and microwave bands
+FREQUENCIES = ['1830', '3550', '7025', '14025', '21030', '28450', '50', '50125', '144', '144200',
+               '222', '432', '903', '1296', '2304', '3400', '5760', '10368', '24192', '47088', '99999']
+
+UNUSUAL_CHARACTERS = ['\r', '\x0b', '\x0c', '\x1c', '\x1e', '\x85', '\xa0', '\u2028', '\u3000', '\xe9']
+
+# Chunk sizes used to check that lines split across reads are stitched back together
+CHUNK_SIZES = [1, 2, 7, 64, 1000, maidenhead_map.CABRILLO_CHUNK_SIZE]
+
+def random_grid(rng):
+    """Random grid square, sometimes lowercase, 6-character or invalid"""
+    grid = (rng.choice('ABCDEFGHIJKLMNOPQR') + rng.choice('ABCDEFGHIJKLMNOPQR') +
+            str(rng.randrange(10)) + str(rng.randrange(10)))
+    if rng.random() < 0.3:
+        grid += rng.choice('abcdefghijklmnopqrstuvwx') + rng.choice('abcdefghijklmnopqrstuvwx')
+    if rng.random() < 0.2:
+        grid = grid.lower()
+    if rng.random() < 0.05:
+        grid = rng.choice(['ZZ99', 'FN3', 'FN31P', 'FN31zz', '1234', 'FN31pr1'])
+    return grid
+
+def qso_line(rng, freq):
+    """Cabrillo QSO line with a random exchange, prefix and field separators"""
+    prefix = rng.choice(['QSO:', 'QSO:', 'QSO:', 'QSO:x', 'QSO:144'])
+    fields = [prefix, freq, rng.choice(['PH', 'CW', 'DG']), '2025-09-13', f"{rng.randrange(2400):04d}",
+              'K2UA', random_grid(rng), f"W{rng.randrange(10)}XYZ", random_grid(rng)]
+    fields += [random_grid(rng) for _ in range(rng.randrange(3))]
+    if rng.random() < 0.05:
+        # Short lines without a full exchange are skipped by both parsers
+        fields = fields[:rng.randrange(2, 7)]
+    separators = [rng.choice([' ', ' ', '  ', '\t', ' \t ']) for _ in fields]
+    return ''.join(field + sep for field, sep in zip(fields, separators)).rstrip(' \t' if rng.random() < 0.5 else '')
+
+def random_log(rng, qsos, unusual=False):
+    """Random Cabrillo log exercising line endings, indentation, prefixes and header lines"""
+    newline = rng.choice(['\n', '\r\n'])
+    # Each log uses a few bands in a random order, so band key order is checked too
+    bands = rng.sample(FREQUENCIES, rng.randint(1, 6))
+    lines = ['START-OF-LOG: 3.0']
+    for i in range(qsos):
+        if rng.random() < 0.02:
+            lines.append(f"CALLSIGN: {rng.choice(['K2UA', 'W1AW', 'N0CALL', ''])}")
+        if rng.random() < 0.02:
+            lines.append(rng.choice(['SOAPBOX: QSO: 144 not a qso', 'X-QSO: 144 PH 2025-09-13 1200 K2UA FN31',
+                                     '', 'CATEGORY-BAND: ALL']))
+        line = qso_line(rng, rng.choice(bands))
+        if rng.random() < 0.1:
+            line = rng.choice([' ', '\t', '  ']) + line
+        lines.append(line)
+    lines.append('END-OF-LOG:')
+    text = newline.join(lines)
+    if rng.random() < 0.5:
+        text += newline
+
+    if unusual:
+        # Bare CR line endings, non-ASCII text and the rarer whitespace str.split() honours
+        for _ in range(rng.randint(1, 5)):
+            position = rng.randrange(len(text))
+            text = text[:position] + rng.choice(UNUSUAL_CHARACTERS) + text[position:]
+    return text
+
+def parse_with_chunk_size(filename, chunk_size):
+    """Run parse_cabrillo_grids with a different read size"""
+    default = maidenhead_map.CABRILLO_CHUNK_SIZE
+    maidenhead_map.CABRILLO_CHUNK_SIZE = chunk_size
+    try:
+        return maidenhead_map.parse_cabrillo_grids(filename)
+    finally:
+        maidenhead_map.CABRILLO_CHUNK_SIZE = default
+
+def check_equivalence(logs, seed, directory):
+    """Compare both parsers, including band order, on random logs at every chunk size"""
+    rng = random.Random(seed)
+    filename = os.path.join(directory, 'equivalence.cbr')
+    failures = 0
+    for i in range(logs):
+        text = random_log(rng, rng.randint(0, 300), unusual=rng.random() < 0.2)
+        with open(filename, 'w', newline='') as f:
+            f.write(text)
+
+        expected = maidenhead_map.parse_cabrillo_lines(filename)
+        for chunk_size in CHUNK_SIZES:
+            actual = parse_with_chunk_size(filename, chunk_size)
+            if actual != expected or list(actual[0]) != list(expected[0]):
+                failures += 1
+                print(f"Mismatch in log {i} at chunk size {chunk_size}:\n"
+                      f"  expected {expected}\n  actual   {actual}")
+                break
+    print(f"Equivalence: {logs - failures}/{logs} random logs match at chunk sizes {CHUNK_SIZES}")
+    return failures == 0
+
+def benchmark(qsos, repeat, seed, directory):
+    """Time both parsers on one large log and print the speedup"""
+    rng = random.Random(seed)
+    filename = os.path.join(directory, 'benchmark.cbr')
+    lines = ['START-OF-LOG: 3.0', 'CALLSIGN: K2UA']
+    for i in range(qsos):
+        freq = rng.choice(FREQUENCIES[:12])
+        lines.append(f"QSO: {freq:>6} PH 2025-09-13 {i % 2400:04d} K2UA          FN20   "
+                     f"W{rng.randrange(10)}XYZ         {random_grid(rng).upper()}")
+    lines.append('END-OF-LOG:')
+    with open(filename, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+    timings = {}
+    for parser in (maidenhead_map.parse_cabrillo_lines, maidenhead_map.parse_cabrillo_grids):
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            parser(filename)
+            best = min(best, time.perf_counter() - start)
+        timings[parser.__name__] = best
+        print(f"{parser.__name__}: {best * 1000:.0f} ms for {qsos} QSOs (best of {repeat})")
+    print(f"Speedup: {timings['parse_cabrillo_lines'] / timings['parse_cabrillo_grids']:.2f}x")
+
+def main():
+    """Check parse_cabrillo_grids against parse_cabrillo_lines and benchmark both"""
+    parser = argparse.ArgumentParser(description='Equivalence check and benchmark for the Cabrillo parsers')
+    parser.add_argument('--logs', type=int, default=300, help='Random logs to compare (default: 300)')
+    parser.add_argument('--qsos', type=int, default=200000, help='QSOs in the benchmark log (default: 200000)')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing runs per parser (default: 5)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for generated logs')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        equivalent = check_equivalence(args.logs, args.seed, directory)
+        benchmark(args.qsos, args.repeat, args.seed, directory)
+    sys.exit(0 if equivalent else 1)
+
+if __name__ == "__main__":
+    main()
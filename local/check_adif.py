@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+import io
+import os
+import sys
+import tempfile
+import contextlib
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, 'lambda'))
+import maidenhead_map
+
+# Small ADIF logs and the grids by band and callsign parse_adif_grids should return for each
+CASES = [
+    ('header and lowercase tags',
+     b'Exported by a logger <GRIDSQUARE:4>AA00 <adif_ver:5>3.1.4 <eoh>\n'
+     b'<call:4>W1AW <band:2>6m <gridsquare:4>fn31 <station_callsign:4>k2ua <eor>\n',
+     ({'6m': ['FN31']}, 'K2UA')),
+    ('type suffixes',
+     b'<EOH><BAND:2:S>2m <GRIDSQUARE:6:G>FN31pr <FREQ:7:N>144.200 <EOR>',
+     ({'2m': ['FN31PR']}, 'Unknown')),
+    ('VUCC_GRIDS alongside GRIDSQUARE',
+     b'<BAND:4>70cm <GRIDSQUARE:4>FN31 <EOR>\n'
+     b'<BAND:4>70cm <VUCC_GRIDS:19>FN31,FN32,fn41,FN42 <EOR>\n'
+     b'<BAND:2>2m <GRIDSQUARE:4>FN20 <VUCC_GRIDS:9>EM89,EM99 <EOR>\n',
+     ({'70cm': ['FN31', 'FN31', 'FN32', 'FN41', 'FN42'], '2m': ['FN20', 'EM89', 'EM99']}, 'Unknown')),
+    ('FREQ-only records',
+     b'<FREQ:7>144.200 <GRIDSQUARE:4>FN31 <EOR>\n'
+     b'<FREQ:6>50.125 <GRIDSQUARE:4>EL87 <EOR>\n'
+     b'<FREQ:6>50.125 <BAND:2>2m <GRIDSQUARE:4>EM90 <EOR>\n',
+     ({'2m': ['FN31', 'EM90'], '6m': ['EL87']}, 'Unknown')),
+    ('non-numeric and non-finite FREQ',
+     b'<FREQ:3>inf <GRIDSQUARE:4>FN31 <EOR><FREQ:5>1e999 <GRIDSQUARE:4>FN20 <EOR>'
+     b'<FREQ:3>nan <GRIDSQUARE:4>EM90 <EOR><FREQ:3>abc <GRIDSQUARE:4>EL87 <EOR>',
+     ({'Unknown': ['FN31', 'FN20', 'EM90', 'EL87']}, 'Unknown')),
+    ('< inside a value',
+     b'<COMMENT:19>x<GRIDSQUARE:4>AA00 <BAND:2>6m <EOR>\n'
+     b'<NOTES:11>a <b> <EOR> <BAND:2>6m <GRIDSQUARE:4>EL87 <EOR>\n',
+     ({'6m': ['EL87']}, 'Unknown')),
+    ('invalid grids, long grids and fields reset per record',
+     b'<BAND:2>6m <GRIDSQUARE:4>ZZ99 <EOR>\n'
+     b'<BAND:2>6m <GRIDSQUARE:8>fn31pr12 <EOR>\n'
+     b'<GRIDSQUARE:4>FN20 <EOR>\n'
+     b'<BAND:2>2m <EOR>\n',
+     ({'6m': ['FN31PR'], 'Unknown': ['FN20']}, 'Unknown')),
+    ('first STATION_CALLSIGN wins',
+     b'<STATION_CALLSIGN:4>K2UA <BAND:2>6m <GRIDSQUARE:4>FN31 <EOR>\n'
+     b'<STATION_CALLSIGN:4>W1AW <BAND:2>6m <GRIDSQUARE:4>FN32 <EOR>\n',
+     ({'6m': ['FN31', 'FN32']}, 'K2UA')),
+    ('empty file', b'', ({}, 'Unknown')),
+]
+
+def check_case(directory, name, content, expected):
+    """Parse one case from a .txt file and check both the result and content-based detection"""
+    filename = os.path.join(directory, 'case.txt')
+    with open(filename, 'wb') as f:
+        f.write(content)
+
+    failures = []
+    actual = maidenhead_map.parse_adif_grids(filename)
+    if actual != expected or list(actual[0]) != list(expected[0]):
+        failures.append(f"expected {expected}\n  actual   {actual}")
+    detected = maidenhead_map.detect_log_format(filename)
+    if content and detected != 'adif':
+        failures.append(f"detected as {detected}, expected adif")
+
+    for failure in failures:
+        print(f"{name}: {failure}")
+    return not failures
+
+def main():
+    """Check parse_adif_grids against hand-written ADIF logs"""
+    with tempfile.TemporaryDirectory() as directory:
+        passed = sum(check_case(directory, *case) for case in CASES)
+        with contextlib.redirect_stdout(io.StringIO()):
+            missing = maidenhead_map.parse_adif_grids(os.path.join(directory, 'missing.adi'))
+    if missing == ({}, 'Unknown'):
+        passed += 1
+    else:
+        print(f"missing file: expected ({{}}, 'Unknown'), actual {missing}")
+
+    print(f"ADIF checks: {passed}/{len(CASES) + 1} passed")
+    sys.exit(0 if passed == len(CASES) + 1 else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+import json
+import time
+import random
+import base64
+import argparse
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+# Band name and the frequency written to synthetic logs (kHz, as in Cabrillo)
+SYNTHETIC_BANDS = [('6m', '50'), ('2m', '144'), ('1.25m', '222'), ('70cm', '432'), ('23cm', '1296')]
+
+def random_grid(rng):
+    """Random 4-character grid square around eastern North America"""
+    field = rng.choice(['EL', 'EM', 'EN', 'FM', 'FN'])
+    return f"{field}{rng.randrange(10)}{rng.randrange(10)}"
+
+def synthetic_log(log_format, qsos, rng, callsign='K2UA'):
+    """Generate a Cabrillo, ADIF or CSV log with random contacts"""
+    lines = []
+    if log_format == 'cabrillo':
+        lines += ['START-OF-LOG: 3.0', f'CALLSIGN: {callsign}', 'CONTEST: ARRL-VHF-SEP']
+    elif log_format == 'adif':
+        lines += ['Synthetic load test log', '<ADIF_VER:5>3.1.4 <EOH>']
+    else:
+        lines.append('callsign,freq,grid,date,time')
+
+    for i in range(qsos):
+        band, freq = rng.choice(SYNTHETIC_BANDS)
+        call = f"W{rng.randrange(10)}{rng.choice(['ABC', 'XY', 'Q', 'KZ'])}"
+        grid = random_grid(rng)
+        time_on = f"{(i // 60) % 24:02d}{i % 60:02d}"
+        if log_format == 'cabrillo':
+            lines.append(f"QSO: {freq:>6} PH 2025-09-13 {time_on} {callsign:<13} FN31   {call:<13} {grid}")
+        elif log_format == 'adif':
+            lines.append(f"<CALL:{len(call)}>{call} <STATION_CALLSIGN:{len(callsign)}>{callsign} "
+                         f"<BAND:{len(band)}>{band} <QSO_DATE:8>20250913 <TIME_ON:4>{time_on} "
+                         f"<GRIDSQUARE:4>{grid} <EOR>")
+        else:
+            lines.append(f"{call},{freq},{grid},2025-09-13,{time_on}")
+
+    return '\n'.join(lines) + '\n'
+
+def request(method, url, payload=None):
+    """Send one request and return status, latency and the server's timing and memory headers"""
+    data = json.dumps(payload).encode('utf-8') if payload is not None else None
+    req = urllib.request.Request(url, data=data, method=method,
+                                 headers={'Content-Type': 'application/json'})
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req) as response:
+            body = response.read()
+            status, headers = response.status, response.headers
+    except urllib.error.HTTPError as e:
+        body = e.read()
+        status, headers = e.code, e.headers
+    except urllib.error.URLError as e:
+        return {'status': 'error', 'error': str(e.reason), 'latency_ms': (time.perf_counter() - start) * 1000}
+
+    return {
+        'status': status,
+        'latency_ms': (time.perf_counter() - start) * 1000,
+        'handler_ms': float(headers.get('X-Duration-Ms') or 0),
+        'peak_rss_mb': float(headers.get('X-Request-Peak-RSS-MB') or 0),
+        'peak_rss_growth_mb': float(headers.get('X-Request-Peak-RSS-Growth-MB') or 0),
+        'child_rss_mb': float(headers.get('X-Max-Child-RSS-MB') or 0),
+        'cold_start': headers.get('X-Cold-Start') == 'true',
+        'body': body,
+    }
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(round(pct / 100 * len(ordered))))
+    return ordered[min(rank, len(ordered)) - 1]
+
+def random_tile_path(rng, dataset, max_zoom):
+    """Random tile over eastern North America at a random zoom level"""
+    z = rng.randint(3, max_zoom)
+    n = 2 ** z
+    # Longitude -100..-60, latitude roughly 25..50 in tile coordinates
+    x = rng.randint(int(n * 80 / 360), int(n * 120 / 360))
+    y = rng.randint(int(n * 0.34), int(n * 0.43))
+    return f"{dataset['datasetId']}/{dataset['tileStyle']}/{rng.choice(dataset['bands'])}/{z}/{x}/{y}.png"
+
+def report(results, elapsed):
+    """Print latency percentiles, throughput and memory figures"""
+    statuses = Counter(result['status'] for result in results)
+    ok = [result for result in results if result['status'] == 200]
+    latencies = [result['latency_ms'] for result in ok]
+    handler_times = [result['handler_ms'] for result in ok]
+    peak_rss = [result['peak_rss_mb'] for result in ok]
+    peak_rss_growth = [result['peak_rss_growth_mb'] for result in ok]
+    child_rss = [result['child_rss_mb'] for result in ok]
+
+    print(f"Requests: {len(results)} in {elapsed:.1f}s ({len(results) / elapsed:.1f} req/s)")
+    print(f"Status codes: {dict(statuses)}")
+    if not ok:
+        return
+    print(f"Cold starts: {sum(result['cold_start'] for result in ok)}")
+    for name, values in (('Latency (ms)', latencies), ('Handler time (ms)', handler_times)):
+        print(f"{name}: p50 {percentile(values, 50):.0f}  p90 {percentile(values, 90):.0f}  "
+              f"p95 {percentile(values, 95):.0f}  p99 {percentile(values, 99):.0f}  max {max(values):.0f}")
+    for name, values in (('Peak RSS per request (MB)', peak_rss),
+                         ('Peak RSS growth per request (MB)', peak_rss_growth)):
+        if any(values):
+            print(f"{name}: p50 {percentile(values, 50):.0f}  "
+                  f"p99 {percentile(values, 99):.0f}  max {max(values):.0f}")
+    if any(child_rss):
+        print(f"Max child process RSS, includes pip (MB): max {max(child_rss):.0f}")
+
+def main():
+    """Replay synthetic logs against a local or deployed API at a target concurrency"""
+    parser = argparse.ArgumentParser(description='Load test the Grid Mapper API with synthetic logs')
+    parser.add_argument('--url', default='http://127.0.0.1:8000/api', help='API base URL')
+    parser.add_argument('--endpoint', choices=['generate-map', 'tiles', 'tile'], default='tiles',
+                        help='generate-map: static PNG maps, tiles: dataset creation, '
+                             'tile: tile requests against one dataset (default: tiles)')
+    parser.add_argument('--format', choices=['cabrillo', 'adif', 'csv'], default='cabrillo',
+                        help='Synthetic log format (default: cabrillo)')
+    parser.add_argument('--qsos', type=int, default=1000, help='QSOs per synthetic log (default: 1000)')
+    parser.add_argument('--requests', type=int, default=50, help='Total requests to send (default: 50)')
+    parser.add_argument('--concurrency', type=int, default=4, help='Requests in flight (default: 4)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for synthetic data')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    extension = {'cabrillo': 'cbr', 'adif': 'adi', 'csv': 'csv'}[args.format]
+
+    def log_payload():
+        log = synthetic_log(args.format, args.qsos, rng)
+        return {
+            'callsign': 'K2UA',
+            'continents': [],
+            'fileName': f'load_test.{extension}',
+            'fileContent': base64.b64encode(log.encode('utf-8')).decode('ascii'),
+        }
+
+    if args.endpoint == 'tile':
+        setup = request('POST', f"{args.url}/tiles", log_payload())
+        if setup['status'] != 200:
+            print(f"Dataset creation failed ({setup['status']}): {setup.get('body') or setup.get('error')}")
+            return
+        dataset = json.loads(setup['body'])
+        paths = [random_tile_path(rng, dataset, dataset['maxZoom'])
+                 for _ in range(args.requests)]
+        jobs = [('GET', f"{args.url}/tiles/{path}", None) for path in paths]
+    else:
+        # Each log is distinct so dataset hashes and S3 keys do not collide across requests
+        jobs = [('POST', f"{args.url}/{args.endpoint}", log_payload()) for _ in range(args.requests)]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(lambda job: request(*job), jobs))
+    report(results, time.perf_counter() - start)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+import os
+import io
+import re
+import sys
+import json
+import time
+import uuid
+import base64
+import argparse
+import resource
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, unquote
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LAMBDA_DIR = os.path.join(ROOT_DIR, 'lambda')
+WEB_DIR = os.path.join(ROOT_DIR, 'web')
+
+# API routes as configured on the API Gateway in lib/grid-mapper-web-stack.ts
+ROUTES = [
+    ('POST', re.compile(r'^/generate-map$'), '/generate-map'),
+    ('POST', re.compile(r'^/tiles$'), '/tiles'),
+    ('GET', re.compile(r'^/tiles/(?P<dataset>[^/]+)/(?P<style>[^/]+)/(?P<band>[^/]+)/(?P<z>[^/]+)/(?P<x>[^/]+)'
+                       r'/(?P<y>[^/]+)$'),
+     '/tiles/{dataset}/{style}/{band}/{z}/{x}/{y}'),
+]
+
+class LocalS3:
+    """Filesystem-backed stand-in for the boto3 S3 client calls made by map_generator"""
+
+    def __init__(self, root, base_url):
+        self.root = root
+        self.base_url = base_url
+
+    def _path(self, bucket, key):
+        path = os.path.normpath(os.path.join(self.root, bucket, key))
+        if not path.startswith(os.path.join(self.root, bucket) + os.sep):
+            raise ValueError(f"Invalid S3 key: {key}")
+        return path
+
+    def upload_file(self, filename, bucket, key):
+        with open(filename, 'rb') as f:
+            self.put_object(Bucket=bucket, Key=key, Body=f.read())
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        path = self._path(Bucket, Key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename so concurrent readers never see a partial object
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(Body if isinstance(Body, bytes) else Body.encode('utf-8'))
+        os.replace(temp_path, path)
+        return {}
+
+    def get_object(self, Bucket, Key):
+        from botocore.exceptions import ClientError
+
+        try:
+            with open(self._path(Bucket, Key), 'rb') as f:
+                return {'Body': io.BytesIO(f.read())}
+        except FileNotFoundError:
+            raise ClientError({'Error': {'Code': 'NoSuchKey', 'Message': Key}}, 'GetObject')
+
+    def generate_presigned_url(self, ClientMethod, Params, ExpiresIn=3600):
+        return f"{self.base_url}/s3/{Params['Bucket']}/{Params['Key']}"
+
+class LocalContext:
+    """Minimal Lambda context object"""
+
+    function_name = 'MapGeneratorFunction'
+    memory_limit_in_mb = 1024
+
+    def __init__(self):
+        self.aws_request_id = str(uuid.uuid4())
+
+# Per-worker state: each worker process stands in for one warm Lambda container
+worker_handler = None
+worker_invocations = 0
+
+def init_worker(storage_dir, base_url, bucket):
+    """Import the Lambda module once per worker and point it at the local S3 stand-in"""
+    global worker_handler
+
+    os.environ['MAPS_BUCKET'] = bucket
+    sys.path.insert(0, LAMBDA_DIR)
+    import map_generator
+
+    map_generator.s3_client = LocalS3(storage_dir, base_url)
+    worker_handler = map_generator.handler
+
+def max_rss_mb(who):
+    """Peak resident set size in MB since the process (or its largest child) started"""
+    rss = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+def reset_peak_rss():
+    """Reset this process's peak RSS (VmHWM) on Linux; returns False where that is unsupported"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+def peak_rss_mb():
+    """Peak RSS in MB since the last reset_peak_rss()"""
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmHWM:'):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+def invoke(event):
+    """Run the handler in this worker and return its response with timing and memory stats"""
+    global worker_invocations
+
+    cold_start = worker_invocations == 0
+    worker_invocations += 1
+
+    # Workers run one request at a time, so process-wide memory figures belong to this request
+    peak_resettable = reset_peak_rss()
+    max_rss_before = max_rss_mb(resource.RUSAGE_SELF)
+
+    start = time.perf_counter()
+    response = worker_handler(event, LocalContext())
+    duration_ms = (time.perf_counter() - start) * 1000
+
+    stats = {
+        'X-Duration-Ms': f"{duration_ms:.1f}",
+        # ru_maxrss of children is the largest child since the worker started, pip installs included
+        'X-Max-Child-RSS-MB': f"{max_rss_mb(resource.RUSAGE_CHILDREN):.1f}",
+        'X-Cold-Start': 'true' if cold_start else 'false',
+        'X-Worker-Pid': str(os.getpid()),
+    }
+    if peak_resettable:
+        stats['X-Request-Peak-RSS-MB'] = f"{peak_rss_mb():.1f}"
+    else:
+        # Without a resettable peak, report how far this request raised the worker's lifetime peak
+        stats['X-Request-Peak-RSS-Growth-MB'] = f"{max_rss_mb(resource.RUSAGE_SELF) - max_rss_before:.1f}"
+    return response, stats
+
+class LocalApiHandler(SimpleHTTPRequestHandler):
+    """Routes /api requests to the worker pool, /s3 to the local bucket and everything else to web/"""
+
+    pool = None
+    storage_dir = None
+    quiet = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=WEB_DIR, **kwargs)
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path.startswith('/s3/'):
+            self.serve_object(unquote(path[len('/s3/'):]))
+        elif not self.dispatch('GET'):
+            super().do_GET()
+
+    def do_POST(self):
+        if not self.dispatch('POST'):
+            self.send_json(404, {'error': 'Not found'})
+
+    def dispatch(self, method):
+        path = unquote(urlparse(self.path).path)
+        if path.startswith('/api/'):
+            path = path[len('/api'):]
+
+        for route_method, pattern, resource_path in ROUTES:
+            match = pattern.match(path)
+            if route_method == method and match:
+                break
+        else:
+            return False
+
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode('utf-8') if length else None
+        event = {
+            'resource': resource_path,
+            'path': path,
+            'httpMethod': method,
+            'headers': dict(self.headers),
+            'pathParameters': match.groupdict() or None,
+            'body': body,
+            'isBase64Encoded': False,
+        }
+
+        try:
+            response, stats = self.pool.submit(invoke, event).result()
+        except Exception as e:
+            self.send_json(502, {'error': f'Worker failed: {str(e)}'})
+            return True
+
+        payload = response.get('body') or ''
+        if response.get('isBase64Encoded'):
+            payload = base64.b64decode(payload)
+        else:
+            payload = payload.encode('utf-8')
+
+        self.send_response(response.get('statusCode', 200))
+        for name, value in {**response.get('headers', {}), **stats}.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+        return True
+
+    def serve_object(self, bucket_key):
+        path = os.path.normpath(os.path.join(self.storage_dir, bucket_key))
+        if not path.startswith(self.storage_dir + os.sep) or not os.path.isfile(path):
+            self.send_json(404, {'error': 'No such key'})
+            return
+        with open(path, 'rb') as f:
+            data = f.read()
+        self.send_response(200)
+        self.send_header('Content-Type', self.guess_type(path))
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_json(self, status_code, payload):
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+def main():
+    """Serve the web UI and the map API locally for development and load testing"""
+    parser = argparse.ArgumentParser(description='Run the Grid Mapper API and web UI locally')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8000, help='Port to listen on (default: 8000)')
+    parser.add_argument('--workers', type=int, default=4,
+                        help='Worker processes, each a warm handler like one Lambda container (default: 4)')
+    parser.add_argument('--storage-dir', default=os.path.join(ROOT_DIR, '.local-s3'),
+                        help='Directory backing the S3 stand-in (default: .local-s3)')
+    parser.add_argument('--bucket', default='grid-mapper-maps-local', help='Maps bucket name')
+    parser.add_argument('--quiet', action='store_true', help='Do not log each request')
+    args = parser.parse_args()
+
+    storage_dir = os.path.abspath(args.storage_dir)
+    os.makedirs(os.path.join(storage_dir, args.bucket), exist_ok=True)
+    base_url = f"http://{args.host}:{args.port}"
+
+    # Spawned workers start clean, as a new Lambda container would
+    pool = ProcessPoolExecutor(max_workers=args.workers,
+                               mp_context=multiprocessing.get_context('spawn'),
+                               initializer=init_worker,
+                               initargs=(storage_dir, base_url, args.bucket))
+    LocalApiHandler.pool = pool
+    LocalApiHandler.storage_dir = storage_dir
+    LocalApiHandler.quiet = args.quiet
+
+    server = ThreadingHTTPServer((args.host, args.port), LocalApiHandler)
+    print(f"Serving Grid Mapper on {base_url} with {args.workers} workers (S3 stand-in: {storage_dir})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        pool.shutdown(cancel_futures=True)
+
+if __name__ == "__main__":
+    main()
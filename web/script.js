@@ -3,6 +3,9 @@
 class GridMapperApp {
     constructor() {
         this.apiUrl = '/api/generate-map';
+        this.tilesUrl = '/api/tiles';
+        this.tileMap = null;
+        this.tileLayer = null;
         this.initializeEventListeners();
     }
 
@@ -22,6 +25,7 @@ class GridMapperApp {
         const formData = new FormData(event.target);
         const callsign = formData.get('callsign');
         const continents = formData.getAll('continents');
+        const outputMode = formData.get('outputMode');
         
         // Get file content
         const fileInput = document.getElementById('logFile');
@@ -52,12 +56,18 @@ class GridMapperApp {
             return;
         }
 
-        await this.generateMaps({
+        const data = {
             callsign: callsign.toUpperCase(),
             continents: continents,
             fileContent: fileContent,
             fileName: fileName
-        });
+        };
+
+        if (outputMode === 'tiles') {
+            await this.generateTileMap(data);
+        } else {
+            await this.generateMaps(data);
+        }
     }
 
     async readFileAsBase64(file) {
@@ -103,6 +113,79 @@ class GridMapperApp {
         }
     }
 
+    async generateTileMap(data) {
+        this.showLoading(true);
+        this.hideError();
+        this.hideResults();
+
+        try {
+            const response = await fetch(this.tilesUrl, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                },
+                body: JSON.stringify(data)
+            });
+
+            const result = await response.json();
+
+            if (!response.ok || !result.success) {
+                throw new Error(result.error || 'Failed to build coverage map');
+            }
+
+            this.showTileMap(result);
+
+        } catch (error) {
+            console.error('Error building coverage map:', error);
+            this.showError('Error building coverage map: ' + error.message);
+        } finally {
+            this.showLoading(false);
+        }
+    }
+
+    showTileMap(result) {
+        const tileResults = document.getElementById('tileResults');
+        const bandSelect = document.getElementById('tileBand');
+
+        tileResults.classList.remove('hidden');
+
+        // Band names come from the uploaded log, so build options as text rather than HTML
+        bandSelect.replaceChildren(...result.bands
+            .map(band => new Option(band === 'all' ? 'All bands' : band, band)));
+        bandSelect.value = 'all';
+        bandSelect.onchange = () => this.setTileBand(result, bandSelect.value);
+
+        if (!this.tileMap) {
+            this.tileMap = L.map('tileMap').setView([40, -90], 3);
+            L.tileLayer('https://tile.openstreetmap.org/{z}/{x}/{y}.png', {
+                maxZoom: result.maxZoom,
+                attribution: '&copy; OpenStreetMap contributors'
+            }).addTo(this.tileMap);
+        }
+
+        // Leaflet only measures the container once it is visible
+        this.tileMap.invalidateSize();
+        this.setTileBand(result, bandSelect.value);
+    }
+
+    setTileBand(result, band) {
+        if (this.tileLayer) {
+            this.tileMap.removeLayer(this.tileLayer);
+        }
+
+        // Tiles are requested only for the area and zoom levels being viewed
+        const url = `${this.tilesUrl}/${result.datasetId}/${result.tileStyle}/${encodeURIComponent(band)}/{z}/{x}/{y}.png`;
+
+        // Leaflet renders attributions as HTML and the callsign is user input, so escape it via a text node
+        const attribution = document.createElement('span');
+        attribution.textContent = `${result.callsign} grid coverage`;
+
+        this.tileLayer = L.tileLayer(url, {
+            maxZoom: result.maxZoom,
+            attribution: attribution.innerHTML
+        }).addTo(this.tileMap);
+    }
+
     showLoading(show) {
         const loadingIndicator = document.getElementById('loadingIndicator');
         const generateBtn = document.getElementById('generateBtn');
@@ -185,6 +268,7 @@ class GridMapperApp {
     hideResults() {
         const resultsDiv = document.getElementById('results');
         resultsDiv.classList.add('hidden');
+        document.getElementById('tileResults').classList.add('hidden');
     }
 
     handleFileSelect(event) {
@@ -216,7 +300,7 @@ class GridMapperApp {
         
         // Reset file info
         const fileInfo = document.querySelector('.file-info');
-        fileInfo.innerHTML = '<small>Supported formats: Cabrillo (.cbr, .log) and CSV (.csv) files</small>';
+        fileInfo.innerHTML = '<small>Supported formats: Cabrillo (.cbr, .log), ADIF (.adi, .adif) and CSV (.csv) files</small>';
     }
 }
 